@@ -0,0 +1,117 @@
+"""
+In-process caching utilities.
+Small TTL cache used to serve hot read paths without a database round trip.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Bounded, per-process cache with time-based expiry.
+
+    Entries expire ``ttl`` seconds after being stored. When the cache is full
+    the least recently used entry is evicted.
+
+    To avoid re-caching a value a concurrent write just replaced, a reader
+    takes ``generation(key)`` before querying and passes it to ``set()``;
+    the value is dropped if ``invalidate()`` or ``clear()`` ran in between.
+
+    The cache lives in the worker process, so every uvicorn worker keeps its
+    own copy and invalidation only reaches the worker that made the write.
+    With WORKERS > 1, other workers keep serving updated or deleted entries
+    until their TTL expires; keep TTLs short.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        # Generation per invalidated key; keys without one are at _base.
+        # Both come from a monotonic counter, so any bump yields a new value.
+        self._counter = 0
+        self._base = 0
+        self._generations: dict = {}
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss or expired entry
+
+        Returns:
+            Cached value or default
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def generation(self, key: Hashable) -> int:
+        """
+        Get the key's current generation, to pass to set() after a read.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Opaque generation number
+        """
+        return self._generations.get(key, self._base)
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            generation: generation(key) taken before the value was read; if
+                the key was invalidated since, the value is not stored
+        """
+        if self.ttl <= 0:
+            return
+        if generation is not None and generation != self.generation(key):
+            return
+
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Remove a single entry if present.
+
+        Args:
+            key: Cache key
+        """
+        self._data.pop(key, None)
+        self._counter += 1
+        self._generations[key] = self._counter
+        if len(self._generations) > self.maxsize:
+            # Moving every key to a new base generation keeps this bounded;
+            # at worst a few in-flight reads skip caching
+            self._bump_all()
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._data.clear()
+        self._bump_all()
+
+    def _bump_all(self) -> None:
+        """Give every key a new generation"""
+        self._counter += 1
+        self._base = self._counter
+        self._generations.clear()
@@ -25,6 +25,9 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 8000
     RELOAD: bool = False
+    WORKERS: int = 1  # each worker opens its own DB pool
+    THREADPOOL_MAX_WORKERS: int = min(32, (os.cpu_count() or 1) * 4)  # password hashing threads
+    BULK_HASH_CONCURRENCY: int = os.cpu_count() or 1  # hashing threads one bulk create may use
 
     # CORS
     CORS_ORIGINS: list[str] = ["http://localhost:3000", "http://localhost:8000"]
@@ -41,6 +44,15 @@ class Settings(BaseSettings):
     DB_POOL_SIZE: int = 10
     DB_MAX_OVERFLOW: int = 20
     DB_POOL_RECYCLE: int = 3600
+    DB_STMT_CACHE_SIZE: int = 64  # prepared statements per connection, 0 disables
+
+    # Cache (in-process, per worker). Writes only invalidate the worker that
+    # made them; with WORKERS > 1 other workers can serve stale users for
+    # up to the TTL
+    CACHE_USER_TTL: int = 30  # seconds, 0 disables
+    CACHE_USER_LIST_TTL: int = 10  # seconds, 0 disables
+    CACHE_MAXSIZE: int = 10000
+    CACHE_HEALTH_TTL: int = 5  # seconds, 0 disables
 
     # Logging
     LOG_LEVEL: str = "INFO"
@@ -53,6 +65,7 @@ class Settings(BaseSettings):
 
     # API
     API_V1_PREFIX: str = "/api/v1"
+    PROCESS_TIME_HEADER: bool = True  # add X-Process-Time to responses
 
     model_config = SettingsConfigDict(
         env_file=".env.dev",  # Default to dev environment
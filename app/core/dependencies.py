@@ -4,8 +4,9 @@ Centralized location for all shared dependencies.
 """
 
 from typing import AsyncGenerator
+from asyncmy import Connection
 from fastapi import Depends, HTTPException, status
-from app.db.database import Database, db
+from app.db.database import Database, LazyConnection, db
 from app.services.user_service import UserService
 
 
@@ -28,16 +29,55 @@ async def get_db() -> Database:
     return db
 
 
+async def get_db_connection(
+    database: Database = Depends(get_db)
+) -> AsyncGenerator[Connection, None]:
+    """
+    Get one pooled connection for the whole request.
+
+    FastAPI caches dependencies per request, so every dependant in the same
+    request shares this connection instead of acquiring its own. The
+    connection is in autocommit mode: each statement commits on its own;
+    wrap writes that must commit together in app.db.database.transaction().
+
+    Yields:
+        Database connection, released back to the pool after the request
+
+    Usage:
+        @router.get("/endpoint")
+        async def my_endpoint(conn: Connection = Depends(get_db_connection)):
+            ...
+    """
+    async with database.get_readonly_connection() as conn:
+        yield conn
+
+
+async def get_lazy_db_connection(
+    database: Database = Depends(get_db)
+) -> AsyncGenerator[LazyConnection, None]:
+    """
+    Get one request-scoped connection that is acquired on first query.
+
+    Services use this rather than get_db_connection(), so requests answered
+    from the in-process caches, or with 304, never wait on the pool.
+
+    Yields:
+        Lazy connection, released back to the pool after the request if used
+    """
+    async with database.get_lazy_connection() as conn:
+        yield conn
+
+
 # ============================================================================
 # SERVICE DEPENDENCIES
 # ============================================================================
 
-async def get_user_service(database: Database = Depends(get_db)) -> UserService:
+async def get_user_service(conn: LazyConnection = Depends(get_lazy_db_connection)) -> UserService:
     """
     Get user service instance.
 
     Args:
-        database: Database instance (injected)
+        conn: Request-scoped, lazily acquired database connection (injected)
 
     Returns:
         UserService instance
@@ -47,7 +87,7 @@ async def get_user_service(database: Database = Depends(get_db)) -> UserService:
         async def get_users(user_service: UserService = Depends(get_user_service)):
             ...
     """
-    return UserService(database)
+    return UserService(conn)
 
 
 # ============================================================================
@@ -98,10 +138,10 @@ async def get_user_service(database: Database = Depends(get_db)) -> UserService:
 
 # Example for future services:
 #
-# async def get_product_service(database: Database = Depends(get_db)) -> ProductService:
+# async def get_product_service(conn: LazyConnection = Depends(get_lazy_db_connection)) -> ProductService:
 #     """Get product service instance"""
-#     return ProductService(database)
+#     return ProductService(conn)
 #
-# async def get_order_service(database: Database = Depends(get_db)) -> OrderService:
+# async def get_order_service(conn: LazyConnection = Depends(get_lazy_db_connection)) -> OrderService:
 #     """Get order service instance"""
-#     return OrderService(database)
+#     return OrderService(conn)
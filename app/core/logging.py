@@ -13,27 +13,40 @@ from app.core.config import settings
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
     """Custom JSON formatter for structured logging"""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Static for the life of the process; resolved once, not per record
+        self._env = settings.ENVIRONMENT
+
     def add_fields(self, log_record: dict, record: logging.LogRecord, message_dict: dict) -> None:
         super().add_fields(log_record, record, message_dict)
         log_record['level'] = record.levelname
         log_record['logger'] = record.name
-        log_record['environment'] = settings.ENVIRONMENT
+        log_record['environment'] = self._env
 
 
 def setup_logging() -> None:
     """
     Configure application logging based on settings.
     """
+    level = getattr(logging, settings.LOG_LEVEL.upper())
+
+    # No formatter prints thread or process details; skip collecting them
+    # for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     # Get root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, settings.LOG_LEVEL.upper()))
+    root_logger.setLevel(level)
 
     # Remove existing handlers
     root_logger.handlers.clear()
 
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, settings.LOG_LEVEL.upper()))
+    console_handler.setLevel(level)
 
     # Set formatter based on configuration
     if settings.LOG_FORMAT == "json":
@@ -52,7 +65,12 @@ def setup_logging() -> None:
 
     # Set third-party loggers to WARNING to reduce noise
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
-    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
+
+    # RequestLoggingMiddleware already logs every request; turn the access
+    # logger off entirely so uvicorn returns before building a record
+    access_logger = logging.getLogger("uvicorn.access")
+    access_logger.disabled = True
+    access_logger.propagate = False
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -4,7 +4,8 @@ Common database helper functions used across repositories.
 """
 
 from typing import Any, Optional, Dict, List
-from aiomysql import Cursor, Connection
+from asyncmy import Connection
+from asyncmy.cursors import Cursor, DictCursor
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -25,14 +26,14 @@ async def execute_query(
     """
     try:
         await cursor.execute(query, params or ())
-        logger.debug(f"Executed query: {query} with params: {params}")
+        logger.debug("Executed query: %s with params: %s", query, params)
     except Exception as e:
-        logger.error(f"Query execution failed: {query}, Error: {e}")
+        logger.error("Query execution failed: %s, Error: %s", query, e)
         raise
 
 
 async def fetch_one(
-    cursor: Cursor,
+    cursor: DictCursor,
     query: str,
     params: Optional[tuple] = None
 ) -> Optional[Dict[str, Any]]:
@@ -40,7 +41,7 @@ async def fetch_one(
     Execute a query and fetch one result as a dictionary.
 
     Args:
-        cursor: Database cursor
+        cursor: Database cursor (must be a DictCursor)
         query: SQL query string
         params: Query parameters (optional)
 
@@ -49,21 +50,15 @@ async def fetch_one(
     """
     try:
         await cursor.execute(query, params or ())
-        result = await cursor.fetchone()
-
-        if result:
-            # Convert tuple result to dictionary
-            columns = [desc[0] for desc in cursor.description]
-            return dict(zip(columns, result))
-        return None
+        return await cursor.fetchone()
 
     except Exception as e:
-        logger.error(f"Query fetch_one failed: {query}, Error: {e}")
+        logger.error("Query fetch_one failed: %s, Error: %s", query, e)
         raise
 
 
 async def fetch_all(
-    cursor: Cursor,
+    cursor: DictCursor,
     query: str,
     params: Optional[tuple] = None
 ) -> List[Dict[str, Any]]:
@@ -71,7 +66,7 @@ async def fetch_all(
     Execute a query and fetch all results as list of dictionaries.
 
     Args:
-        cursor: Database cursor
+        cursor: Database cursor (must be a DictCursor)
         query: SQL query string
         params: Query parameters (optional)
 
@@ -80,16 +75,10 @@ async def fetch_all(
     """
     try:
         await cursor.execute(query, params or ())
-        results = await cursor.fetchall()
-
-        if results:
-            # Convert tuple results to list of dictionaries
-            columns = [desc[0] for desc in cursor.description]
-            return [dict(zip(columns, row)) for row in results]
-        return []
+        return list(await cursor.fetchall())
 
     except Exception as e:
-        logger.error(f"Query fetch_all failed: {query}, Error: {e}")
+        logger.error("Query fetch_all failed: %s, Error: %s", query, e)
         raise
 
 
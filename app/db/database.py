@@ -1,17 +1,50 @@
 """
 Async MySQL database connection pool management.
-Uses aiomysql for async database operations.
+Uses asyncmy for async database operations.
 """
 
-import aiomysql
-from typing import Optional
+import asyncio
+import asyncmy
+from typing import AsyncIterator, Optional, Type
 from contextlib import asynccontextmanager
+from asyncmy import Connection
+from asyncmy.cursors import Cursor
 from app.core.config import settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+@asynccontextmanager
+async def transaction(conn: Connection) -> AsyncIterator[Connection]:
+    """
+    Run statements on an autocommit connection inside a transaction.
+    Commits on success and rolls back on error.
+
+    If the connection is already in a transaction, the statements join it
+    and its owner decides whether to commit (BEGIN would otherwise
+    implicitly commit the outer transaction).
+
+    Usage:
+        async with transaction(conn):
+            async with conn.cursor() as cursor:
+                await cursor.execute("UPDATE users SET ...")
+    """
+    if conn.get_transaction_status():
+        yield conn
+        return
+
+    await conn.begin()
+    try:
+        yield conn
+    except Exception as e:
+        await conn.rollback()
+        logger.error("Database operation failed: %s", e)
+        raise
+    else:
+        await conn.commit()
+
+
 class Database:
     """
     Database connection pool manager.
@@ -19,31 +52,47 @@ class Database:
     """
 
     def __init__(self):
-        self.pool: Optional[aiomysql.Pool] = None
+        self.pool: Optional[asyncmy.Pool] = None
 
     async def connect(self) -> None:
         """
         Create database connection pool.
         """
+        # DB_POOL_SIZE is the steady-state size; DB_MAX_OVERFLOW extra
+        # connections absorb bursts instead of queueing on acquire()
+        maxsize = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+        minsize = min(max(4, settings.DB_POOL_SIZE // 4), maxsize)
+
         try:
-            self.pool = await aiomysql.create_pool(
+            self.pool = await asyncmy.create_pool(
                 host=settings.DB_HOST,
                 port=settings.DB_PORT,
                 user=settings.DB_USER,
                 password=settings.DB_PASSWORD,
-                db=settings.DB_NAME,
-                minsize=1,
-                maxsize=settings.DB_POOL_SIZE,
-                autocommit=False,
+                database=settings.DB_NAME,
+                minsize=minsize,
+                maxsize=maxsize,
+                # Recycle idle connections before the server's wait_timeout
+                # drops them, so acquire() never hands out a dead socket
+                pool_recycle=settings.DB_POOL_RECYCLE,
+                # Every statement commits on its own; get_connection() and
+                # transaction() are for writes spanning several statements
+                autocommit=True,
                 charset='utf8mb4',
+                # Keep TIMESTAMP columns in UTC so app-side timestamps and
+                # CURRENT_TIMESTAMP defaults agree
+                init_command="SET time_zone = '+00:00'",
+                # Run parameterized queries as cached server-side prepared
+                # statements (binary protocol, parsed once per connection)
+                stmt_cache_size=settings.DB_STMT_CACHE_SIZE,
                 echo=settings.DEBUG,
             )
             logger.info(
-                f"Database connection pool created: "
-                f"{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}"
+                "Database connection pool created: %s:%s/%s (min=%d, max=%d)",
+                settings.DB_HOST, settings.DB_PORT, settings.DB_NAME, minsize, maxsize
             )
         except Exception as e:
-            logger.error(f"Failed to create database connection pool: {e}")
+            logger.error("Failed to create database connection pool: %s", e)
             raise
 
     async def disconnect(self) -> None:
@@ -58,7 +107,8 @@ class Database:
     @asynccontextmanager
     async def get_connection(self):
         """
-        Get a database connection from the pool.
+        Get a database connection from the pool inside a transaction.
+        Commits on success and rolls back on error.
 
         Usage:
             async with db.get_connection() as conn:
@@ -69,14 +119,100 @@ class Database:
             raise RuntimeError("Database pool not initialized. Call connect() first.")
 
         async with self.pool.acquire() as conn:
-            try:
+            async with transaction(conn):
                 yield conn
-            except Exception as e:
-                await conn.rollback()
-                logger.error(f"Database operation failed: {e}")
-                raise
-            else:
-                await conn.commit()
+
+    @asynccontextmanager
+    async def get_readonly_connection(self):
+        """
+        Get a database connection without transaction control.
+
+        Statements run in autocommit mode, so no BEGIN/COMMIT round trips are
+        sent. Use get_connection(), or wrap statements in transaction(conn),
+        when several writes must commit together.
+
+        Usage:
+            async with db.get_readonly_connection() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute("SELECT * FROM users")
+        """
+        if not self.pool:
+            raise RuntimeError("Database pool not initialized. Call connect() first.")
+
+        async with self.pool.acquire() as conn:
+            yield conn
+
+    @asynccontextmanager
+    async def get_lazy_connection(self):
+        """
+        Get a connection that is only taken from the pool when first used.
+
+        Like get_readonly_connection(), but requests that never reach the
+        database (cache hits, 304 responses) don't hold or wait for a
+        pooled connection.
+
+        Usage:
+            async with db.get_lazy_connection() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute("SELECT * FROM users")
+        """
+        if not self.pool:
+            raise RuntimeError("Database pool not initialized. Call connect() first.")
+
+        conn = LazyConnection(self.pool)
+        try:
+            yield conn
+        finally:
+            await conn.release()
+
+
+class LazyConnection:
+    """
+    Stand-in for a pooled autocommit connection, acquired on first use.
+    Supports cursor() like asyncmy.Connection; use acquire() for anything else.
+    """
+
+    def __init__(self, pool: asyncmy.Pool):
+        self._pool = pool
+        self._conn: Optional[Connection] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def acquired(self) -> bool:
+        """Whether a connection has been taken from the pool"""
+        return self._conn is not None
+
+    async def acquire(self) -> Connection:
+        """
+        Get the underlying connection, taking it from the pool if needed.
+
+        Returns:
+            Pooled connection, kept until release()
+        """
+        if self._conn is None:
+            # Services sharing this object may start querying concurrently
+            async with self._lock:
+                if self._conn is None:
+                    self._conn = await self._pool.acquire()
+        return self._conn
+
+    @asynccontextmanager
+    async def cursor(self, cursor: Optional[Type[Cursor]] = None) -> AsyncIterator[Cursor]:
+        """
+        Open a cursor on the underlying connection.
+
+        Args:
+            cursor: Cursor class, as for asyncmy.Connection.cursor()
+        """
+        conn = await self.acquire()
+        async with conn.cursor(cursor) as cur:
+            yield cur
+
+    async def release(self) -> None:
+        """Return the connection to the pool, if one was taken"""
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            await self._pool.release(conn)
 
 
 # Global database instance
@@ -0,0 +1,196 @@
+"""
+Helpers for applying SQL migration files.
+Shared by scripts/init_db.py and scripts/run_migrations.py.
+"""
+
+import re
+from typing import Iterable, List
+from asyncmy.constants import ER
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Explicitly marks a migration file as containing DDL
+DDL_MARKER = "-- @ddl"
+DDL_STATEMENT = re.compile(r"^\s*(CREATE|ALTER|DROP|RENAME|TRUNCATE)\b", re.IGNORECASE | re.MULTILINE)
+
+# Errors a DDL statement raises when its change is already in place, e.g.
+# when a file that failed part way through is run again
+ALREADY_APPLIED_ERRORS = frozenset({
+    ER.TABLE_EXISTS_ERROR,
+    ER.BAD_TABLE_ERROR,
+    ER.DUP_FIELDNAME,
+    ER.DUP_KEYNAME,
+    ER.CANT_DROP_FIELD_OR_KEY,
+})
+
+
+def is_ddl_migration(sql_content: str) -> bool:
+    """
+    Check whether a migration changes the schema.
+
+    MySQL implicitly commits around DDL, so such files can't be rolled back
+    as a whole. A file is DDL if it starts with the -- @ddl marker or has a
+    statement starting with a DDL keyword.
+
+    Args:
+        sql_content: Contents of a migration file
+
+    Returns:
+        True if the file contains DDL
+    """
+    return (
+        sql_content.lstrip().startswith(DDL_MARKER)
+        or DDL_STATEMENT.search(sql_content) is not None
+    )
+
+
+def split_sql_statements(sql_content: str) -> List[str]:
+    """
+    Split a migration file into statements on ';'.
+
+    Comment-only chunks are dropped so the result lines up with the
+    statements MySQL runs for the same text. Migration files must not use
+    ';' inside comments or string literals.
+
+    Args:
+        sql_content: Contents of a migration file
+
+    Returns:
+        Statements in file order
+    """
+    statements = []
+    for chunk in sql_content.split(';'):
+        code = [
+            line for line in chunk.splitlines()
+            if line.strip() and not line.strip().startswith('--')
+        ]
+        if code:
+            statements.append(chunk.strip())
+    return statements
+
+
+async def execute_sql_file(cursor, sql_content: str, stop_on_error: bool = False) -> bool:
+    """
+    Execute a migration file's statements.
+
+    Sends the whole file as one multi-statement query (a single round trip).
+    MySQL stops at the first failing statement; everything before it has
+    already been applied, so execution resumes one statement at a time from
+    the failed statement onwards. Re-running the failed statement is safe
+    because it was not applied, and it also covers servers or drivers that
+    reject multi-statement queries.
+
+    Statements whose change already exists (see ALREADY_APPLIED_ERRORS) are
+    skipped, so a file that failed part way through can be run again.
+
+    Args:
+        cursor: Cursor on a connection with CLIENT.MULTI_STATEMENTS
+        sql_content: Contents of a migration file
+        stop_on_error: Stop at the first failing statement instead of
+            logging it and running the rest
+
+    Returns:
+        True if every statement succeeded, False if any failed
+    """
+    # Statements whose results have been read, i.e. that succeeded
+    completed = 0
+    try:
+        await cursor.execute(sql_content)
+        completed = 1
+        # Consume every statement's result before the connection is reused
+        while await cursor.nextset():
+            completed += 1
+        return True
+    except Exception as e:
+        logger.warning(
+            "Batched execution stopped at statement %d, running the rest one by one: %s",
+            completed + 1, e
+        )
+
+    succeeded = True
+    for statement in split_sql_statements(sql_content)[completed:]:
+        try:
+            await cursor.execute(statement)
+        except Exception as e:
+            if e.args and e.args[0] in ALREADY_APPLIED_ERRORS:
+                logger.info("Statement already applied, skipping: %s", e)
+                continue
+            logger.warning("Statement execution warning: %s", e)
+            succeeded = False
+            if stop_on_error:
+                break
+    return succeeded
+
+
+async def execute_dml_file(conn, cursor, sql_content: str) -> None:
+    """
+    Execute a data-only migration file in a single transaction.
+
+    Any failure rolls back the whole file, so it can be fixed and re-run
+    without leaving half of its changes behind.
+
+    Args:
+        conn: Connection the cursor belongs to
+        cursor: Cursor on a connection with CLIENT.MULTI_STATEMENTS
+        sql_content: Contents of a migration file
+    """
+    await conn.begin()
+    try:
+        await cursor.execute(sql_content)
+        while await cursor.nextset():
+            pass
+    except Exception:
+        await conn.rollback()
+        raise
+    await conn.commit()
+
+
+async def record_migrations(cursor, migration_files: Iterable[str]) -> None:
+    """
+    Mark migrations as applied with a single multi-row INSERT.
+
+    Migration files also record themselves; the upsert makes recording the
+    same file twice a no-op.
+
+    Args:
+        cursor: Database cursor
+        migration_files: Names of the applied migration files
+    """
+    # Placeholders only, so executemany rewrites this into one statement
+    await cursor.executemany(
+        "INSERT INTO schema_migrations (migration_file) VALUES (%s) "
+        "ON DUPLICATE KEY UPDATE migration_file = migration_file",
+        [(name,) for name in migration_files]
+    )
+
+
+async def apply_migration(conn, cursor, name: str, sql_content: str) -> None:
+    """
+    Apply one pending migration file.
+
+    DDL commits implicitly and is atomic per statement in MySQL 8, so a DDL
+    file is only batched. It stops at its first failing statement, so the
+    INSERT that records the file, which comes last, never runs and the file
+    stays pending; running it again skips the statements already applied.
+    Data-only files run in one transaction.
+
+    Args:
+        conn: Connection the cursor belongs to
+        cursor: Cursor on a connection with CLIENT.MULTI_STATEMENTS
+        name: Migration file name, for error messages
+        sql_content: Contents of the migration file
+
+    Raises:
+        RuntimeError: If a statement in a DDL file failed
+    """
+    if not is_ddl_migration(sql_content):
+        await execute_dml_file(conn, cursor, sql_content)
+        return
+
+    if not await execute_sql_file(cursor, sql_content, stop_on_error=True):
+        # Discard DML run since the last DDL statement; it is run again
+        # with the rest of the file
+        await conn.rollback()
+        raise RuntimeError(f"Migration {name} had failing statements")
+    await conn.commit()
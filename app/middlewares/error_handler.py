@@ -4,7 +4,7 @@ Catches and formats all application errors consistently.
 """
 
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from app.core.logging import get_logger
@@ -24,10 +24,11 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
         JSON response with error details
     """
     logger.warning(
-        f"HTTP {exc.status_code} error on {request.method} {request.url.path}: {exc.detail}"
+        "HTTP %d error on %s %s: %s",
+        exc.status_code, request.method, request.url.path, exc.detail
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
@@ -51,10 +52,11 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     """
     errors = exc.errors()
     logger.warning(
-        f"Validation error on {request.method} {request.url.path}: {errors}"
+        "Validation error on %s %s: %s",
+        request.method, request.url.path, errors
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "success": False,
@@ -78,11 +80,12 @@ async def general_exception_handler(request: Request, exc: Exception):
         JSON response with generic error message
     """
     logger.error(
-        f"Unhandled exception on {request.method} {request.url.path}: {exc}",
+        "Unhandled exception on %s %s: %s",
+        request.method, request.url.path, exc,
         exc_info=True
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "success": False,
@@ -3,64 +3,88 @@ Request/Response logging middleware.
 Logs all incoming requests and outgoing responses for monitoring.
 """
 
+import logging
 import time
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """
     Middleware to log all HTTP requests and responses.
     Tracks request duration and response status codes.
+
+    Implemented as a plain ASGI middleware rather than BaseHTTPMiddleware,
+    so requests are not bridged through an extra task and memory stream
+    and streaming responses pass through untouched.
     """
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process each request and log details.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in chain
-
-        Returns:
-            HTTP response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Start timer
-        start_time = time.time()
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Start timer (monotonic, integer nanoseconds)
+        start_ns = time.perf_counter_ns()
 
-        # Get client information
-        client_host = request.client.host if request.client else "unknown"
+        # Get request information
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+        client_host = client[0] if client else "unknown"
 
         # Log incoming request
         logger.info(
-            f"Incoming request: {request.method} {request.url.path} from {client_host}"
+            "Incoming request: %s %s from %s",
+            method, path, client_host
         )
 
-        # Process request
-        try:
-            response = await call_next(request)
-
-            # Calculate duration
-            duration = time.time() - start_time
+        status_code = 500
+        add_process_time = settings.PROCESS_TIME_HEADER
 
-            # Log response
-            logger.info(
-                f"Request completed: {request.method} {request.url.path} "
-                f"- Status: {response.status_code} - Duration: {duration:.3f}s"
-            )
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
 
-            # Add custom headers
-            response.headers["X-Process-Time"] = str(duration)
+                # Add custom headers
+                if add_process_time:
+                    elapsed_ns = time.perf_counter_ns() - start_ns
+                    headers = MutableHeaders(scope=message)
+                    headers.append("X-Process-Time", f"{elapsed_ns / 1_000_000_000:.6f}")
 
-            return response
+            await send(message)
 
+        # Process request
+        try:
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            duration = time.time() - start_time
+            duration = (time.perf_counter_ns() - start_ns) / 1_000_000_000
             logger.error(
-                f"Request failed: {request.method} {request.url.path} "
-                f"- Duration: {duration:.3f}s - Error: {str(e)}"
+                "Request failed: %s %s - Duration: %.3fs - Error: %s",
+                method, path, duration, e
             )
             raise
+
+        # Log response
+        if logger.isEnabledFor(logging.INFO):
+            duration = (time.perf_counter_ns() - start_ns) / 1_000_000_000
+            logger.info(
+                "Request completed: %s %s - Status: %d - Duration: %.3fs",
+                method, path, status_code, duration
+            )
@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends
 from app.schemas.common_schema import HealthCheck
 from app.db.database import Database
 from app.core.dependencies import get_db
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.core.logging import get_logger
 
@@ -14,6 +15,10 @@ logger = get_logger(__name__)
 
 router = APIRouter()
 
+# Probes arrive every few seconds; reuse the last DB check briefly
+# instead of taking a pooled connection for each one
+_health_cache = TTLCache(ttl=settings.CACHE_HEALTH_TTL, maxsize=1)
+
 
 @router.get(
     "/",
@@ -29,25 +34,34 @@ async def health_check(database: Database = Depends(get_db)):
     - Service status
     - API version
     - Environment name
-    - Database connection status
+    - Database connection status (cached for CACHE_HEALTH_TTL seconds)
+    - Database pool size and idle connections
     """
-    db_status = "disconnected"
-
-    try:
-        # Test database connection
-        async with database.get_connection() as conn:
-            async with conn.cursor() as cursor:
-                await cursor.execute("SELECT 1")
-                result = await cursor.fetchone()
-                if result:
-                    db_status = "connected"
-    except Exception as e:
-        logger.error(f"Database health check failed: {e}")
-        db_status = f"error: {str(e)[:50]}"
+    db_status = _health_cache.get("database")
+
+    if db_status is None:
+        db_status = "disconnected"
+
+        try:
+            # Test database connection
+            async with database.get_readonly_connection() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute("SELECT 1")
+                    result = await cursor.fetchone()
+                    if result:
+                        db_status = "connected"
+        except Exception as e:
+            logger.error("Database health check failed: %s", e)
+            db_status = f"error: {str(e)[:50]}"
+
+        _health_cache.set("database", db_status)
 
+    pool = database.pool
     return HealthCheck(
         status="healthy" if db_status == "connected" else "degraded",
         version=settings.APP_VERSION,
         environment=settings.ENVIRONMENT,
-        database=db_status
+        database=db_status,
+        pool_size=pool.size if pool else None,
+        pool_free=pool.freesize if pool else None
     )
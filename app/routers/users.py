@@ -3,12 +3,21 @@ User API endpoints.
 RESTful routes for user management.
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from app.schemas.user_schema import UserCreate, UserUpdate, UserResponse, UserListItem
-from app.schemas.common_schema import SuccessResponse, ErrorResponse
+import hashlib
+import math
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import List, Optional
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from fastapi.responses import ORJSONResponse
+from app.schemas.user_schema import (
+    UserCreate, UserBulkCreate, UserUpdate, UserResponse, UserListItem
+)
+from app.schemas.common_schema import SuccessResponse, ErrorResponse, PaginatedResponse
 from app.services.user_service import UserService
 from app.core.dependencies import get_user_service
+from app.core.config import settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -16,32 +25,121 @@ logger = get_logger(__name__)
 router = APIRouter()
 
 
+def _compute_etag(body: bytes) -> str:
+    """Strong ETag over a serialized response payload"""
+    return f'"{hashlib.md5(body).hexdigest()}"'
+
+
+def _list_etag(version: str, *params) -> str:
+    """Weak ETag for a list page: the list version plus the query parameters"""
+    return f'W/"{version}-{"-".join(str(param) for param in params)}"'
+
+
+def _http_date(value: datetime) -> str:
+    """Format a naive UTC timestamp from the database as an HTTP date"""
+    return format_datetime(value.replace(tzinfo=timezone.utc), usegmt=True)
+
+
+def _is_not_modified(
+    request: Request,
+    etag: str,
+    last_modified: Optional[datetime] = None
+) -> bool:
+    """
+    Evaluate the request's conditional headers for a GET.
+
+    If-None-Match takes precedence; If-Modified-Since is only checked
+    without it, as RFC 9110 requires.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+        last_modified: Naive UTC modification time of the resource (optional)
+
+    Returns:
+        True if the client's copy is current and 304 can be sent
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # Weak comparison, as RFC 9110 requires for If-None-Match
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag.removeprefix("W/") in candidates or "*" in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if last_modified is None or not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP dates have second precision, like the TIMESTAMP columns
+    return last_modified.replace(tzinfo=timezone.utc) <= since
+
+
 @router.get(
     "/",
-    response_model=SuccessResponse[List[UserListItem]],
+    # Rows already match UserListItem; skip per-row validation and
+    # serialization and keep the schema for the docs only
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": PaginatedResponse[UserListItem]}},
     summary="Get all users",
     description="Retrieve a list of all users with pagination support"
 )
 async def get_users(
+    request: Request,
     limit: int = Query(100, ge=1, le=500, description="Maximum number of users to return"),
     offset: int = Query(0, ge=0, description="Number of users to skip"),
+    after_id: Optional[int] = Query(
+        None, ge=1, description="Return users with an ID lower than this (overrides offset)"
+    ),
+    is_active: Optional[bool] = Query(None, description="Filter by active status"),
     user_service: UserService = Depends(get_user_service)
 ):
     """
-    Get all users with pagination.
+    Get all users with pagination, newest first.
+
+    Responds with a weak ETag for the current version of the list; send it
+    back in If-None-Match to get 304 Not Modified instead of the body until
+    a user is created, updated or deleted (or CACHE_USER_LIST_TTL passes).
 
     - **limit**: Maximum number of users (1-500)
     - **offset**: Number of users to skip for pagination
+    - **after_id**: Keyset cursor; pass next_cursor from the previous page
+    - **is_active**: Only return active (true) or inactive (false) users
     """
     try:
-        users = await user_service.get_all_users(limit=limit, offset=offset)
-        return SuccessResponse(
-            success=True,
-            message=f"Retrieved {len(users)} users",
-            data=users
+        # Checked before fetching: a current client costs no query and no
+        # serialization. The version is taken first, so a write during the
+        # fetch can only make the tag older than the page, never newer
+        cache_headers = {
+            "ETag": _list_etag(
+                user_service.get_list_version(), limit, offset, after_id, is_active
+            ),
+            "Cache-Control": f"private, max-age={settings.CACHE_USER_LIST_TTL}",
+        }
+        if _is_not_modified(request, cache_headers["ETag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+        users, total = await user_service.get_all_users(
+            limit=limit, offset=offset, after_id=after_id, is_active=is_active
         )
+        body = orjson.dumps({
+            "success": True,
+            "data": users,
+            "total": total,
+            # Keyset pages have no position to number
+            "page": offset // limit + 1 if after_id is None else None,
+            "page_size": limit,
+            "total_pages": math.ceil(total / limit),
+            # A short page is the last one
+            "next_cursor": users[-1]['id'] if len(users) == limit else None
+        })
+
+        return Response(content=body, media_type="application/json", headers=cache_headers)
     except Exception as e:
-        logger.error(f"Failed to retrieve users: {e}")
+        logger.error("Failed to retrieve users: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve users"
@@ -56,11 +154,17 @@ async def get_users(
 )
 async def get_user(
     user_id: int,
+    request: Request,
+    response: Response,
     user_service: UserService = Depends(get_user_service)
 ):
     """
     Get a specific user by ID.
 
+    Responds with ETag and Last-Modified; send them back in If-None-Match
+    or If-Modified-Since to get 304 Not Modified instead of the body while
+    the user is unchanged.
+
     - **user_id**: The ID of the user to retrieve
     """
     try:
@@ -72,6 +176,16 @@ async def get_user(
                 detail=f"User with ID {user_id} not found"
             )
 
+        cache_headers = {
+            "ETag": _compute_etag(orjson.dumps(user)),
+            "Cache-Control": f"private, max-age={settings.CACHE_USER_TTL}",
+        }
+        if user.get('updated_at'):
+            cache_headers["Last-Modified"] = _http_date(user['updated_at'])
+        if _is_not_modified(request, cache_headers["ETag"], user.get('updated_at')):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+        response.headers.update(cache_headers)
+
         return SuccessResponse(
             success=True,
             message="User retrieved successfully",
@@ -80,7 +194,7 @@ async def get_user(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to retrieve user {user_id}: {e}")
+        logger.error("Failed to retrieve user %d: %s", user_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve user"
@@ -119,13 +233,49 @@ async def create_user(
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Failed to create user: {e}")
+        logger.error("Failed to create user: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create user"
         )
 
 
+@router.post(
+    "/bulk",
+    response_model=SuccessResponse[List[UserResponse]],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create users in bulk",
+    description="Create up to 100 users in a single database round trip"
+)
+async def create_users_bulk(
+    bulk_data: UserBulkCreate,
+    user_service: UserService = Depends(get_user_service)
+):
+    """
+    Create several users at once. Either all users are created or none.
+
+    - **users**: List of 1-100 users, each with the same fields as a single create
+    """
+    try:
+        users = await user_service.create_users_bulk(bulk_data.users)
+        return SuccessResponse(
+            success=True,
+            message=f"Created {len(users)} users",
+            data=users
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error("Failed to create users in bulk: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to create users"
+        )
+
+
 @router.put(
     "/{user_id}",
     response_model=SuccessResponse[UserResponse],
@@ -167,7 +317,7 @@ async def update_user(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to update user {user_id}: {e}")
+        logger.error("Failed to update user %d: %s", user_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update user"
@@ -206,7 +356,7 @@ async def delete_user(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to delete user {user_id}: {e}")
+        logger.error("Failed to delete user %d: %s", user_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete user"
@@ -215,7 +365,8 @@ async def delete_user(
 
 @router.get(
     "/search/",
-    response_model=SuccessResponse[List[UserListItem]],
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": SuccessResponse[List[UserListItem]]}},
     summary="Search users",
     description="Search for users by name"
 )
@@ -232,13 +383,13 @@ async def search_users(
     """
     try:
         users = await user_service.search_users(search_term=q, limit=limit)
-        return SuccessResponse(
-            success=True,
-            message=f"Found {len(users)} matching users",
-            data=users
-        )
+        return ORJSONResponse({
+            "success": True,
+            "message": f"Found {len(users)} matching users",
+            "data": users
+        })
     except Exception as e:
-        logger.error(f"Failed to search users: {e}")
+        logger.error("Failed to search users: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to search users"
@@ -35,9 +35,14 @@ class PaginatedResponse(BaseModel, Generic[T]):
     success: bool = True
     data: List[T] = Field(..., description="List of items")
     total: int = Field(..., description="Total count of items")
-    page: int = Field(..., description="Current page number")
+    page: Optional[int] = Field(
+        None, description="Current page number; null for keyset (cursor) pages"
+    )
     page_size: int = Field(..., description="Number of items per page")
     total_pages: int = Field(..., description="Total number of pages")
+    next_cursor: Optional[int] = Field(
+        None, description="Keyset cursor for the next page (pass as after_id); null on the last page"
+    )
 
 
 class HealthCheck(BaseModel):
@@ -46,3 +51,5 @@ class HealthCheck(BaseModel):
     version: str = Field(..., description="API version")
     environment: str = Field(..., description="Environment name")
     database: str = Field(..., description="Database connection status")
+    pool_size: Optional[int] = Field(None, description="Open connections in the database pool")
+    pool_free: Optional[int] = Field(None, description="Idle connections in the database pool")
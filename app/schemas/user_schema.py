@@ -3,7 +3,7 @@ Pydantic schemas for User model.
 Request and response schemas for user-related endpoints.
 """
 
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
 
@@ -22,6 +22,13 @@ class UserCreate(UserBase):
     is_active: bool = Field(True, description="Whether the user account is active")
 
 
+class UserBulkCreate(BaseModel):
+    """Schema for creating several users in one request"""
+    users: List[UserCreate] = Field(
+        ..., min_length=1, max_length=100, description="Users to create (1-100)"
+    )
+
+
 class UserUpdate(BaseModel):
     """Schema for updating a user (all fields optional)"""
     name: Optional[str] = Field(None, min_length=1, max_length=100, description="User's full name")
@@ -33,6 +40,8 @@ class UserUpdate(BaseModel):
 class UserResponse(UserBase):
     """Schema for user response"""
     id: int = Field(..., description="User ID")
+    # Emails were validated on the way in; skip re-validating stored values
+    email: str = Field(..., description="User's email address")
     is_active: bool = Field(..., description="Whether the user account is active")
     created_at: Optional[datetime] = Field(None, description="Account creation timestamp")
     updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
@@ -44,7 +53,7 @@ class UserListItem(BaseModel):
     """Simplified user schema for list endpoints"""
     id: int = Field(..., description="User ID")
     name: str = Field(..., description="User's full name")
-    email: EmailStr = Field(..., description="User's email address")
+    email: str = Field(..., description="User's email address")
     is_active: bool = Field(..., description="Whether the user account is active")
 
     model_config = ConfigDict(from_attributes=True)
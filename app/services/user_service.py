@@ -3,24 +3,117 @@ User service layer containing business logic.
 Handles user-related operations with direct SQL queries.
 """
 
-from typing import List, Optional, Dict, Any
-from app.db.database import Database
+import asyncio
+import re
+import secrets
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple, Union
+from asyncmy import Connection
+from asyncmy.constants import ER
+from asyncmy.cursors import DictCursor
+from asyncmy.errors import IntegrityError
+from app.db.database import LazyConnection
 from app.db.base import fetch_one, fetch_all, execute_query, get_last_insert_id
 from app.schemas.user_schema import UserCreate, UserUpdate
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash_async
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Read-through caches for the hot GET paths, invalidated on writes
+user_cache = TTLCache(ttl=settings.CACHE_USER_TTL, maxsize=settings.CACHE_MAXSIZE)
+user_list_cache = TTLCache(ttl=settings.CACHE_USER_LIST_TTL, maxsize=256)
+
+# Columns returned to API clients; the password hash never leaves the DB
+USER_PUBLIC_COLS = "id, name, email, is_active, created_at, updated_at"
+
+# Columns returned by list endpoints (matches UserListItem). List rows are
+# sent to clients without going through the schema, so is_active (TINYINT)
+# is converted to bool in the service.
+USER_LIST_COLS = "id, name, email, is_active"
+
+# INSERT used for every new user; UserCreate always yields all of these
+USER_INSERT_COLS = ("name", "email", "password", "is_active", "created_at", "updated_at")
+USER_INSERT_SQL = (
+    f"INSERT INTO users ({', '.join(USER_INSERT_COLS)}) "
+    f"VALUES ({', '.join(['%s'] * len(USER_INSERT_COLS))})"
+)
+
+# user_list_cache key of the list version token (see get_list_version)
+LIST_VERSION_KEY = "version"
+
+# InnoDB's default innodb_ft_min_token_size; shorter terms use a LIKE prefix match
+FULLTEXT_MIN_TOKEN_SIZE = 3
+
+# Characters with special meaning in MATCH ... AGAINST (... IN BOOLEAN MODE)
+_FULLTEXT_OPERATORS = re.compile(r'[+\-<>()~*"@]')
+
+
+@lru_cache(maxsize=8)
+def build_update_sql(fields: Tuple[str, ...]) -> str:
+    """
+    Build the UPDATE statement for a set of changed columns.
+
+    UserUpdate has three optional fields, so there are at most seven shapes;
+    each is built once and then reused. updated_at is always set last, from
+    a value supplied by the caller.
+
+    Args:
+        fields: Column names to set, in UserUpdate field order
+
+    Returns:
+        Parameterized UPDATE statement ending in WHERE id = %s
+    """
+    set_clause = ', '.join(f"{field} = %s" for field in (*fields, 'updated_at'))
+    return f"UPDATE users SET {set_clause} WHERE id = %s"
+
+
+def build_search_query(search_term: str, limit: int) -> Tuple[str, Tuple[Any, ...]]:
+    """
+    Build the name search statement for a search term.
+
+    Args:
+        search_term: Raw search term from the client
+        limit: Maximum number of results
+
+    Returns:
+        Parameterized SELECT statement and its parameters
+    """
+    # Drop boolean-mode operators so user input is only ever words
+    words = _FULLTEXT_OPERATORS.sub(' ', search_term).split()
+
+    if not words or min(len(word) for word in words) < FULLTEXT_MIN_TOKEN_SIZE:
+        # Escape LIKE wildcards; a leading-anchored pattern can use idx_name
+        prefix = search_term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        query = f"SELECT {USER_LIST_COLS} FROM users WHERE name LIKE %s LIMIT %s"
+        params = (f"{prefix}%", limit)
+    else:
+        # Every word must match, each as a word prefix
+        query = (
+            f"SELECT {USER_LIST_COLS} FROM users "
+            "WHERE MATCH(name) AGAINST (%s IN BOOLEAN MODE) LIMIT %s"
+        )
+        params = (' '.join(f"+{word}*" for word in words), limit)
+
+    return query, params
+
 
 class UserService:
     """
     Service class for user business logic.
     Executes SQL queries directly and implements business rules.
+
+    Works on a request-scoped connection in autocommit mode: every write is
+    a single statement that commits on its own, so no BEGIN/COMMIT round
+    trips are sent. With a LazyConnection, calls answered from the caches
+    never take a connection from the pool.
     """
 
-    def __init__(self, db: Database):
-        self.db = db
+    def __init__(self, conn: Union[Connection, LazyConnection]):
+        self.conn = conn
 
     async def get_user_by_id(self, user_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -32,46 +125,123 @@ class UserService:
         Returns:
             User data dictionary or None
         """
-        async with self.db.get_connection() as conn:
-            async with conn.cursor() as cursor:
-                query = "SELECT * FROM users WHERE id = %s"
-                user = await fetch_one(cursor, query, (user_id,))
+        cached = user_cache.get(user_id)
+        if cached is not None:
+            return cached
+        # A write that commits while the SELECT is in flight bumps this,
+        # so the pre-write row is not cached after its invalidation
+        generation = user_cache.generation(user_id)
+
+        async with self.conn.cursor(DictCursor) as cursor:
+            query = f"SELECT {USER_PUBLIC_COLS} FROM users WHERE id = %s"
+            user = await fetch_one(cursor, query, (user_id,))
+
+            if user:
+                logger.info("Retrieved user with ID: %d", user_id)
+                user_cache.set(user_id, user, generation)
+            else:
+                logger.warning("User not found with ID: %d", user_id)
+
+            return user
+
+    def get_list_version(self) -> str:
+        """
+        Get an opaque version of the user list, for list ETags.
 
-                if user:
-                    logger.info(f"Retrieved user with ID: {user_id}")
-                    # Remove password from response
-                    user.pop('password', None)
-                else:
-                    logger.warning(f"User not found with ID: {user_id}")
+        The version is a random token kept in user_list_cache, so it is
+        replaced by every write (which clears that cache) and at the latest
+        after CACHE_USER_LIST_TTL; with WORKERS > 1 a client can be told a
+        list is unchanged for that long after another worker's write, as
+        with the list cache itself. No query is needed, so conditional
+        requests are answered without touching the database. With a TTL of
+        0 every call returns a new version.
 
-                return user
+        Returns:
+            Version token, unique across worker processes
+        """
+        version = user_list_cache.get(LIST_VERSION_KEY)
+        if version is None:
+            version = secrets.token_hex(8)
+            user_list_cache.set(LIST_VERSION_KEY, version)
+        return version
 
     async def get_all_users(
         self,
         limit: int = 100,
-        offset: int = 0
-    ) -> List[Dict[str, Any]]:
+        offset: int = 0,
+        after_id: Optional[int] = None,
+        is_active: Optional[bool] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
         """
-        Get all users with pagination.
+        Get all users with pagination, newest first.
+
+        When after_id is given, keyset pagination is used: only users with a
+        lower ID are returned and offset is ignored. Pass the ID of the last
+        user from the previous page to fetch the next one without scanning
+        the skipped rows.
 
         Args:
             limit: Maximum number of users to return
             offset: Number of users to skip
+            after_id: Return users with an ID lower than this (keyset cursor)
+            is_active: Only return users with this active status (optional)
 
         Returns:
-            List of user dictionaries
+            Tuple of (page of user dictionaries, total matching users)
         """
-        async with self.db.get_connection() as conn:
-            async with conn.cursor() as cursor:
-                query = "SELECT * FROM users ORDER BY created_at DESC LIMIT %s OFFSET %s"
-                users = await fetch_all(cursor, query, (limit, offset))
-
-                # Remove passwords from all users
+        cache_key = (limit, offset, after_id, is_active)
+        cached = user_list_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        generation = user_list_cache.generation(cache_key)
+
+        # The total ignores the cursor: it counts every user matching the filter
+        filter_clause = " WHERE is_active = %s" if is_active is not None else ""
+        filter_params = [is_active] if is_active is not None else []
+
+        # InnoDB appends the primary key to idx_is_active, making it
+        # (is_active, id): it serves both the filter and ORDER BY id DESC
+        conditions = ["is_active = %s"] if is_active is not None else []
+        where_params = list(filter_params)
+
+        if after_id is not None:
+            conditions.append("id < %s")
+            where_params.append(after_id)
+
+        where_clause = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+
+        # The total comes back in the same round trip as an uncorrelated
+        # subquery, which MySQL evaluates once from the smallest covering
+        # index; the page itself still stops reading after LIMIT rows
+        query = (
+            f"SELECT {USER_LIST_COLS}, "
+            f"(SELECT COUNT(*) FROM users{filter_clause}) AS total "
+            f"FROM users {where_clause}ORDER BY id DESC LIMIT %s"
+        )
+        params = filter_params + where_params + [limit]
+
+        if after_id is None:
+            query += " OFFSET %s"
+            params.append(offset)
+
+        async with self.conn.cursor(DictCursor) as cursor:
+            users = await fetch_all(cursor, query, tuple(params))
+
+            if users:
+                total = users[0]['total']
                 for user in users:
-                    user.pop('password', None)
-
-                logger.info(f"Retrieved {len(users)} users")
-                return users
+                    del user['total']
+                    user['is_active'] = bool(user['is_active'])
+            elif offset or after_id is not None:
+                # Past the last page there is no row to carry the total
+                count_query = f"SELECT COUNT(*) AS total FROM users{filter_clause}"
+                total = (await fetch_one(cursor, count_query, tuple(filter_params)))['total']
+            else:
+                total = 0
+
+            logger.info("Retrieved %d of %d users", len(users), total)
+            user_list_cache.set(cache_key, (users, total), generation)
+            return users, total
 
     async def create_user(self, user_data: UserCreate) -> Dict[str, Any]:
         """
@@ -86,42 +256,126 @@ class UserService:
         Raises:
             ValueError: If user with email already exists
         """
-        async with self.db.get_connection() as conn:
-            async with conn.cursor() as cursor:
-                # Check if user with email already exists
-                check_query = "SELECT * FROM users WHERE email = %s"
-                existing_user = await fetch_one(cursor, check_query, (user_data.email,))
-
-                if existing_user:
-                    logger.warning(f"User creation failed: Email {user_data.email} already exists")
-                    raise ValueError(f"User with email {user_data.email} already exists")
-
-                # Prepare user data
-                user_dict = user_data.model_dump()
+        # Prepare user data
+        user_dict = user_data.model_dump()
+
+        # Hash password if provided (CPU-bound, so off the event loop)
+        if user_dict.get('password'):
+            user_dict['password'] = await get_password_hash_async(user_dict['password'])
+
+        # Set timestamps here so the response matches the stored row
+        # without reading it back (TIMESTAMP has second precision)
+        now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+        user_dict['created_at'] = now
+        user_dict['updated_at'] = now
+
+        # A single INSERT commits atomically in autocommit mode; no
+        # BEGIN/COMMIT round trips are needed
+        async with self.conn.cursor(DictCursor) as cursor:
+            # Create user; the unique index on email rejects duplicates,
+            # so no separate existence check is needed
+            values = tuple(user_dict[column] for column in USER_INSERT_COLS)
+            try:
+                # Called directly: a duplicate is an expected outcome,
+                # not a query failure for execute_query to log
+                await cursor.execute(USER_INSERT_SQL, values)
+            except IntegrityError as e:
+                if e.args[0] != ER.DUP_ENTRY:
+                    raise
+                logger.warning("User creation failed: Email %s already exists", user_data.email)
+                raise ValueError(f"User with email {user_data.email} already exists")
+            user_id = await get_last_insert_id(cursor)
+
+            # Build the response from the inserted values
+            user_dict.pop('password', None)
+            created_user = {'id': user_id, **user_dict}
+
+            logger.info("Created user with ID: %d, Email: %s", user_id, user_data.email)
+
+        # Invalidate only after the INSERT has committed
+        user_list_cache.clear()
+        return created_user
+
+    async def create_users_bulk(self, users: List[UserCreate]) -> List[Dict[str, Any]]:
+        """
+        Create several users with a single multi-row INSERT.
 
-                # Hash password if provided
-                if user_dict.get('password'):
-                    user_dict['password'] = get_password_hash(user_dict['password'])
+        The batch is all-or-nothing: if any email already exists, no user is
+        created. IDs are derived from the first generated ID, which relies
+        on InnoDB allocating consecutive values to a single multi-row
+        INSERT (auto_increment_increment = 1).
 
-                # Create user
-                columns = ', '.join(user_dict.keys())
-                placeholders = ', '.join(['%s'] * len(user_dict))
-                insert_query = f"INSERT INTO users ({columns}) VALUES ({placeholders})"
-                await execute_query(cursor, insert_query, tuple(user_dict.values()))
-                user_id = await get_last_insert_id(cursor)
+        Args:
+            users: User creation data (kept small enough for one statement)
 
-                # Retrieve created user
-                select_query = "SELECT * FROM users WHERE id = %s"
-                created_user = await fetch_one(cursor, select_query, (user_id,))
-                created_user.pop('password', None)
+        Returns:
+            Created users' data, in input order
 
-                logger.info(f"Created user with ID: {user_id}, Email: {user_data.email}")
-                return created_user
+        Raises:
+            ValueError: If an email is repeated in the batch or already exists
+        """
+        # The unique index on email is case-insensitive (utf8mb4_unicode_ci)
+        emails = [user.email.lower() for user in users]
+        if len(set(emails)) != len(emails):
+            raise ValueError("Duplicate emails in request")
+
+        user_dicts = [user.model_dump() for user in users]
+
+        # Hashing is CPU-bound and argon2 releases the GIL: hash passwords in
+        # parallel on the default executor, not one after another. Each hash
+        # holds a thread and 19 MiB, so one batch may only use
+        # BULK_HASH_CONCURRENCY threads, leaving the rest for other requests
+        with_password = [d for d in user_dicts if d.get('password')]
+        hash_slots = asyncio.Semaphore(settings.BULK_HASH_CONCURRENCY)
+
+        async def hash_password(password: str) -> str:
+            async with hash_slots:
+                return await get_password_hash_async(password)
+
+        hashes = await asyncio.gather(*(hash_password(d['password']) for d in with_password))
+        for user_dict, hashed in zip(with_password, hashes):
+            user_dict['password'] = hashed
+
+        now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+        for user_dict in user_dicts:
+            user_dict['created_at'] = now
+            user_dict['updated_at'] = now
+        rows = [
+            tuple(user_dict[column] for column in USER_INSERT_COLS)
+            for user_dict in user_dicts
+        ]
+
+        # One multi-row INSERT is atomic on its own in autocommit mode.
+        # executemany only splits the batch past ~1 MB of SQL, far more than
+        # the 100 rows UserBulkCreate allows
+        async with self.conn.cursor(DictCursor) as cursor:
+            try:
+                await cursor.executemany(USER_INSERT_SQL, rows)
+            except IntegrityError as e:
+                if e.args[0] != ER.DUP_ENTRY:
+                    raise
+                logger.warning("Bulk user creation failed: %s", e)
+                raise ValueError("One or more users with these emails already exist")
+
+            # For a multi-row INSERT, lastrowid is the first generated ID
+            first_id = cursor.lastrowid
+
+        created_users = []
+        for offset, user_dict in enumerate(user_dicts):
+            user_dict.pop('password', None)
+            created_users.append({'id': first_id + offset, **user_dict})
+
+        logger.info("Created %d users starting at ID: %d", len(created_users), first_id)
+
+        # Invalidate only after the INSERT has committed
+        user_list_cache.clear()
+        return created_users
 
     async def update_user(
         self,
         user_id: int,
-        user_data: UserUpdate
+        user_data: UserUpdate,
+        return_row: bool = True
     ) -> Optional[Dict[str, Any]]:
         """
         Update user information.
@@ -129,6 +383,9 @@ class UserService:
         Args:
             user_id: User ID
             user_data: User update data
+            return_row: Reselect and return the full updated row. When False,
+                no reselect is made and only the ID, the changed fields and
+                updated_at are returned.
 
         Returns:
             Updated user data or None if user not found
@@ -136,40 +393,61 @@ class UserService:
         Raises:
             ValueError: If email is already taken by another user
         """
-        async with self.db.get_connection() as conn:
-            async with conn.cursor() as cursor:
-                # Check if user exists
-                check_query = "SELECT * FROM users WHERE id = %s"
-                existing_user = await fetch_one(cursor, check_query, (user_id,))
-
-                if not existing_user:
-                    logger.warning(f"User update failed: User not found with ID: {user_id}")
-                    return None
-
-                # Check if email is being changed to one that already exists
-                if user_data.email and user_data.email != existing_user['email']:
-                    email_query = "SELECT * FROM users WHERE email = %s"
-                    email_user = await fetch_one(cursor, email_query, (user_data.email,))
-                    if email_user and email_user['id'] != user_id:
-                        logger.warning(f"User update failed: Email {user_data.email} already exists")
-                        raise ValueError(f"Email {user_data.email} is already taken")
-
-                # Update only provided fields
-                update_dict = user_data.model_dump(exclude_unset=True)
-
-                if update_dict:
-                    set_clause = ', '.join([f"{key} = %s" for key in update_dict.keys()])
-                    update_query = f"UPDATE users SET {set_clause} WHERE id = %s"
-                    values = tuple(update_dict.values()) + (user_id,)
-                    await execute_query(cursor, update_query, values)
-                    logger.info(f"Updated user with ID: {user_id}")
-
-                # Retrieve updated user
-                select_query = "SELECT * FROM users WHERE id = %s"
+        # Update only provided fields
+        update_dict = user_data.model_dump(exclude_unset=True)
+
+        # Set updated_at here, as in create_user, so callers that skip the
+        # reselect still get the stored value
+        now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+
+        # The UPDATE commits on its own in autocommit mode, so a PUT is two
+        # round trips (UPDATE, reselect) with no BEGIN/COMMIT. The reselect
+        # may see a concurrent write made after ours; that row is newer, so
+        # it is still a correct response
+        async with self.conn.cursor(DictCursor) as cursor:
+            changed = False
+
+            if update_dict:
+                # model_dump keeps schema field order, so the key tuple
+                # is canonical and the cached SQL can be reused
+                update_query = build_update_sql(tuple(update_dict))
+                values = (*update_dict.values(), now, user_id)
+                try:
+                    # The unique index on email rejects a taken address
+                    await cursor.execute(update_query, values)
+                except IntegrityError as e:
+                    if e.args[0] != ER.DUP_ENTRY:
+                        raise
+                    logger.warning("User update failed: Email %s already exists", user_data.email)
+                    raise ValueError(f"Email {user_data.email} is already taken")
+                changed = cursor.rowcount > 0
+
+            if return_row:
+                # The reselect doubles as the existence check
+                select_query = f"SELECT {USER_PUBLIC_COLS} FROM users WHERE id = %s"
                 updated_user = await fetch_one(cursor, select_query, (user_id,))
-                updated_user.pop('password', None)
-
-                return updated_user
+            else:
+                updated_user = {'id': user_id, **update_dict}
+                if update_dict:
+                    updated_user['updated_at'] = now
+                if not changed:
+                    # No rows changed: missing user, nothing to update, or
+                    # an identical update within the same second
+                    exists_query = "SELECT 1 AS found FROM users WHERE id = %s"
+                    if not await fetch_one(cursor, exists_query, (user_id,)):
+                        updated_user = None
+
+            if not updated_user:
+                logger.warning("User update failed: User not found with ID: %d", user_id)
+                return None
+
+            if changed:
+                logger.info("Updated user with ID: %d", user_id)
+
+        # Invalidate only after the UPDATE has committed
+        user_cache.invalidate(user_id)
+        user_list_cache.clear()
+        return updated_user
 
     async def delete_user(self, user_id: int) -> bool:
         """
@@ -181,18 +459,21 @@ class UserService:
         Returns:
             True if user was deleted, False if user not found
         """
-        async with self.db.get_connection() as conn:
-            async with conn.cursor() as cursor:
-                delete_query = "DELETE FROM users WHERE id = %s"
-                await execute_query(cursor, delete_query, (user_id,))
-                deleted = cursor.rowcount > 0
-
-                if deleted:
-                    logger.info(f"Deleted user with ID: {user_id}")
-                else:
-                    logger.warning(f"User deletion failed: User not found with ID: {user_id}")
-
-                return deleted
+        async with self.conn.cursor(DictCursor) as cursor:
+            delete_query = "DELETE FROM users WHERE id = %s"
+            await execute_query(cursor, delete_query, (user_id,))
+            deleted = cursor.rowcount > 0
+
+            if deleted:
+                logger.info("Deleted user with ID: %d", user_id)
+            else:
+                logger.warning("User deletion failed: User not found with ID: %d", user_id)
+
+        # Invalidate only after the DELETE has committed
+        if deleted:
+            user_cache.invalidate(user_id)
+            user_list_cache.clear()
+        return deleted
 
     async def search_users(
         self,
@@ -202,6 +483,11 @@ class UserService:
         """
         Search users by name.
 
+        Matches names containing words that start with each word of the
+        search term, using the ft_users_name FULLTEXT index. Terms with a
+        word shorter than the FULLTEXT minimum token size fall back to a
+        name prefix match on idx_name.
+
         Args:
             search_term: Search term
             limit: Maximum number of results
@@ -209,15 +495,12 @@ class UserService:
         Returns:
             List of matching users
         """
-        async with self.db.get_connection() as conn:
-            async with conn.cursor() as cursor:
-                search_query = "SELECT * FROM users WHERE name LIKE %s LIMIT %s"
-                search_pattern = f"%{search_term}%"
-                users = await fetch_all(cursor, search_query, (search_pattern, limit))
+        search_query, params = build_search_query(search_term, limit)
 
-                # Remove passwords
-                for user in users:
-                    user.pop('password', None)
+        async with self.conn.cursor(DictCursor) as cursor:
+            users = await fetch_all(cursor, search_query, params)
+            for user in users:
+                user['is_active'] = bool(user['is_active'])
 
-                logger.info(f"Found {len(users)} users matching: {search_term}")
-                return users
+            logger.info("Found %d users matching: %s", len(users), search_term)
+            return users
@@ -0,0 +1,14 @@
+-- Migration: 002_add_name_search_indexes
+-- Description: Indexes backing user search by name
+-- Date: 2026-10-14
+
+-- Inverted index for MATCH(name) AGAINST (... IN BOOLEAN MODE) word-prefix search,
+-- replacing the full table scan of name LIKE '%term%'
+ALTER TABLE users ADD FULLTEXT INDEX ft_users_name (name);
+
+-- B-tree index for the LIKE 'term%' prefix fallback used for very short terms
+ALTER TABLE users ADD INDEX idx_name (name);
+
+-- Record this migration
+INSERT INTO schema_migrations (migration_file) VALUES ('002_add_name_search_indexes.sql')
+ON DUPLICATE KEY UPDATE migration_file = migration_file;
@@ -11,8 +11,10 @@ from pathlib import Path
 # Add parent directory to path to import app modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import aiomysql
+import asyncmy
+from asyncmy.constants import CLIENT
 from app.core.config import settings
+from app.db.migrations import execute_sql_file
 from app.core.logging import setup_logging, get_logger
 
 setup_logging()
@@ -23,7 +25,7 @@ async def create_database():
     """Create the database if it doesn't exist"""
     try:
         # Connect to MySQL without specifying database
-        conn = await aiomysql.connect(
+        conn = await asyncmy.connect(
             host=settings.DB_HOST,
             port=settings.DB_PORT,
             user=settings.DB_USER,
@@ -49,12 +51,14 @@ async def run_migrations():
     """Run all SQL migration files"""
     try:
         # Connect to the database
-        conn = await aiomysql.connect(
+        conn = await asyncmy.connect(
             host=settings.DB_HOST,
             port=settings.DB_PORT,
             user=settings.DB_USER,
             password=settings.DB_PASSWORD,
-            db=settings.DB_NAME
+            database=settings.DB_NAME,
+            # Lets each migration file run as one batched query
+            client_flag=CLIENT.MULTI_STATEMENTS
         )
 
         migrations_dir = Path(__file__).parent.parent / "migrations"
@@ -70,18 +74,16 @@ async def run_migrations():
 
             # Execute migration
             async with conn.cursor() as cursor:
-                # Split by semicolon and execute each statement
-                statements = [s.strip() for s in sql_content.split(';') if s.strip()]
-
-                for statement in statements:
-                    try:
-                        await cursor.execute(statement)
-                    except Exception as e:
-                        logger.warning(f"Statement execution warning: {e}")
-                        # Continue with other statements
-
+                succeeded = await execute_sql_file(cursor, sql_content)
                 await conn.commit()
 
+            # Existing schema objects are skipped, but re-running a migration
+            # can still fail, e.g. on seed rows that already exist; report it
+            # and carry on with the rest
+            if not succeeded:
+                logger.warning(f"Migration {migration_file.name} completed with failing statements")
+                continue
+
             logger.info(f" Completed migration: {migration_file.name}")
 
         conn.close()
@@ -11,8 +11,10 @@ from pathlib import Path
 # Add parent directory to path to import app modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import aiomysql
+import asyncmy
+from asyncmy.constants import CLIENT
 from app.core.config import settings
+from app.db.migrations import apply_migration, record_migrations
 from app.core.logging import setup_logging, get_logger
 
 setup_logging()
@@ -34,12 +36,14 @@ async def run_pending_migrations():
     """Run only migrations that haven't been applied yet"""
     try:
         # Connect to database
-        conn = await aiomysql.connect(
+        conn = await asyncmy.connect(
             host=settings.DB_HOST,
             port=settings.DB_PORT,
             user=settings.DB_USER,
             password=settings.DB_PASSWORD,
-            db=settings.DB_NAME
+            database=settings.DB_NAME,
+            # Lets each migration file run as one batched query
+            client_flag=CLIENT.MULTI_STATEMENTS
         )
 
         migrations_dir = Path(__file__).parent.parent / "migrations"
@@ -67,24 +71,26 @@ async def run_pending_migrations():
             logger.info(f"Found {len(pending)} pending migrations")
 
             # Run each pending migration
-            for migration_file in pending:
-                logger.info(f"Applying migration: {migration_file.name}")
-
-                # Read migration SQL
-                sql_content = migration_file.read_text()
-
-                # Execute migration statements
-                statements = [s.strip() for s in sql_content.split(';') if s.strip()]
-
-                for statement in statements:
-                    try:
-                        await cursor.execute(statement)
-                    except Exception as e:
-                        logger.warning(f"Statement execution warning: {e}")
-
-                await conn.commit()
-
-                logger.info(f" Applied: {migration_file.name}")
+            applied_now = []
+            try:
+                for migration_file in pending:
+                    logger.info(f"Applying migration: {migration_file.name}")
+
+                    # Read migration SQL
+                    sql_content = migration_file.read_text()
+
+                    # A failing file stays pending to be retried once fixed;
+                    # later files may depend on it, so stop here
+                    await apply_migration(conn, cursor, migration_file.name, sql_content)
+
+                    applied_now.append(migration_file.name)
+                    logger.info(f" Applied: {migration_file.name}")
+            finally:
+                # Record every file that fully succeeded, even if a later
+                # file failed, in one multi-row INSERT
+                if applied_now:
+                    await record_migrations(cursor, applied_now)
+                    await conn.commit()
 
         conn.close()
         logger.info(" All pending migrations applied successfully!")
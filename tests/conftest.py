@@ -3,45 +3,72 @@ Pytest configuration and fixtures.
 Shared test fixtures for the test suite.
 """
 
-import pytest
 import asyncio
+import pytest
+import pytest_asyncio
 from typing import AsyncGenerator
-from httpx import AsyncClient
+from asyncmy import Connection
+from httpx import ASGITransport, AsyncClient
 from app.main import app
 from app.db.database import db
+from app.services.user_service import user_cache, user_list_cache
+
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
 
 
 @pytest.fixture(scope="session")
-def event_loop():
+def event_loop_policy():
     """
-    Create an event loop for the test session.
+    Use uvloop, the loop the app runs on in production, where installed.
     """
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+    if uvloop is None:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
 
 
-@pytest.fixture
-async def client() -> AsyncGenerator[AsyncClient, None]:
+def pytest_collection_modifyitems(items):
+    """
+    Run every async test in the single session-scoped event loop shared
+    with the fixtures (see asyncio_default_fixture_loop_scope in pytest.ini).
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session")
+async def client(test_db) -> AsyncGenerator[AsyncClient, None]:
     """
     Create an async HTTP client for testing endpoints.
+    Shared by the whole session; the database pool comes from test_db,
+    since ASGITransport does not run the app's lifespan.
 
     Usage:
         async def test_endpoint(client):
             response = await client.get("/api/v1/users")
             assert response.status_code == 200
     """
-    async with AsyncClient(app=app, base_url="http://test") as ac:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 async def test_db():
     """
     Setup and teardown test database connection.
+    Connects once for the whole session; use tx for per-test isolation.
+    Tests that need the database are skipped when it is unreachable.
     """
     # Setup: Connect to test database
-    await db.connect()
+    try:
+        await db.connect()
+    except Exception as e:
+        pytest.skip(f"Test database unavailable: {e}")
 
     yield db
 
@@ -49,10 +76,21 @@ async def test_db():
     await db.disconnect()
 
 
-# Add more fixtures here as needed
-# Example:
-# @pytest.fixture
-# async def test_user(test_db):
-#     """Create a test user"""
-#     # Create and return a test user
-#     pass
+@pytest.fixture
+async def tx(test_db) -> AsyncGenerator[Connection, None]:
+    """
+    Pooled connection inside a transaction that is rolled back after the test.
+
+    Usage:
+        async def test_create_user(tx):
+            user = await UserService(tx).create_user(...)
+    """
+    async with test_db.pool.acquire() as conn:
+        await conn.begin()
+        try:
+            yield conn
+        finally:
+            await conn.rollback()
+            # Don't let rows that were rolled back linger in the read caches
+            user_cache.clear()
+            user_list_cache.clear()
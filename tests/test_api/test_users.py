@@ -0,0 +1,195 @@
+"""
+Tests for the users router.
+"""
+
+from datetime import datetime
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.requests import Request
+from app.core.dependencies import get_user_service
+from app.main import app
+from app.routers.users import _compute_etag, _http_date, _is_not_modified, _list_etag
+
+ETAG = _compute_etag(b'{"id":1}')
+LAST_MODIFIED = datetime(2024, 1, 2, 3, 4, 5)
+
+
+def make_request(**headers: str) -> Request:
+    """Build a GET request carrying the given headers (underscores become dashes)"""
+    raw_headers = [
+        (name.replace('_', '-').encode('latin-1'), value.encode('latin-1'))
+        for name, value in headers.items()
+    ]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw_headers})
+
+
+@pytest.mark.unit
+class TestIsNotModified:
+    """Conditional GET evaluation"""
+
+    def test_no_conditional_headers(self):
+        assert not _is_not_modified(make_request(), ETAG, LAST_MODIFIED)
+
+    def test_if_none_match_matches(self):
+        assert _is_not_modified(make_request(if_none_match=ETAG), ETAG)
+
+    def test_if_none_match_differs(self):
+        assert not _is_not_modified(make_request(if_none_match='"stale"'), ETAG)
+
+    def test_if_none_match_list(self):
+        request = make_request(if_none_match=f'"stale", {ETAG}')
+        assert _is_not_modified(request, ETAG)
+
+    def test_if_none_match_weak_tag(self):
+        assert _is_not_modified(make_request(if_none_match=f"W/{ETAG}"), ETAG)
+
+    def test_weak_resource_etag(self):
+        etag = _list_etag("v1", 100, 0, None, None)
+        assert _is_not_modified(make_request(if_none_match=etag), etag)
+        assert _is_not_modified(make_request(if_none_match=etag.removeprefix("W/")), etag)
+
+    def test_if_none_match_wildcard(self):
+        assert _is_not_modified(make_request(if_none_match="*"), ETAG)
+
+    def test_if_none_match_takes_precedence(self):
+        # A current If-Modified-Since must not override a stale ETag
+        request = make_request(
+            if_none_match='"stale"',
+            if_modified_since=_http_date(LAST_MODIFIED),
+        )
+        assert not _is_not_modified(request, ETAG, LAST_MODIFIED)
+
+    def test_if_modified_since_equal(self):
+        request = make_request(if_modified_since=_http_date(LAST_MODIFIED))
+        assert _is_not_modified(request, ETAG, LAST_MODIFIED)
+
+    def test_if_modified_since_newer(self):
+        request = make_request(if_modified_since="Wed, 03 Jan 2024 00:00:00 GMT")
+        assert _is_not_modified(request, ETAG, LAST_MODIFIED)
+
+    def test_if_modified_since_older(self):
+        request = make_request(if_modified_since="Mon, 01 Jan 2024 00:00:00 GMT")
+        assert not _is_not_modified(request, ETAG, LAST_MODIFIED)
+
+    def test_if_modified_since_unparseable(self):
+        request = make_request(if_modified_since="not a date")
+        assert not _is_not_modified(request, ETAG, LAST_MODIFIED)
+
+    def test_if_modified_since_without_last_modified(self):
+        request = make_request(if_modified_since=_http_date(LAST_MODIFIED))
+        assert not _is_not_modified(request, ETAG)
+
+
+class FakeUserService:
+    """UserService stand-in that serves fixed users and counts list queries"""
+
+    def __init__(self, users):
+        self.users = users
+        self.version = "v1"
+        self.list_queries = 0
+
+    def get_list_version(self):
+        return self.version
+
+    async def get_all_users(self, limit, offset, after_id, is_active):
+        self.list_queries += 1
+        users = [u for u in self.users if after_id is None or u['id'] < after_id]
+        return users[offset if after_id is None else 0:][:limit], len(self.users)
+
+    async def get_user_by_id(self, user_id):
+        return next((u for u in self.users if u['id'] == user_id), None)
+
+
+@pytest.fixture
+def user_service():
+    return FakeUserService([
+        {'id': user_id, 'name': f"User {user_id}",
+         'email': f"user{user_id}@example.com", 'is_active': True,
+         'created_at': LAST_MODIFIED, 'updated_at': LAST_MODIFIED}
+        for user_id in (5, 4, 3)
+    ])
+
+
+@pytest.fixture
+async def api(user_service):
+    """HTTP client for the app with the user service replaced"""
+    app.dependency_overrides[get_user_service] = lambda: user_service
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            yield client
+    finally:
+        app.dependency_overrides.pop(get_user_service, None)
+
+
+@pytest.mark.unit
+class TestListConditionalGet:
+    """GET /users/ with If-None-Match"""
+
+    async def test_returns_weak_etag(self, api):
+        response = await api.get("/api/v1/users/")
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('W/"v1-')
+
+    async def test_not_modified_skips_the_query(self, api, user_service):
+        etag = (await api.get("/api/v1/users/")).headers["etag"]
+        response = await api.get("/api/v1/users/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert user_service.list_queries == 1
+
+    async def test_new_version_returns_page(self, api, user_service):
+        etag = (await api.get("/api/v1/users/")).headers["etag"]
+        user_service.version = "v2"
+        response = await api.get("/api/v1/users/", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["data"]
+
+    async def test_etag_depends_on_query(self, api):
+        first = (await api.get("/api/v1/users/?limit=2")).headers["etag"]
+        second = (await api.get("/api/v1/users/?limit=2&offset=2")).headers["etag"]
+        assert first != second
+
+
+@pytest.mark.unit
+class TestListPagination:
+    """GET /users/ page metadata"""
+
+    async def test_full_page_has_next_cursor(self, api):
+        body = (await api.get("/api/v1/users/?limit=2")).json()
+        assert [user["id"] for user in body["data"]] == [5, 4]
+        assert body["next_cursor"] == 4
+        assert body["page"] == 1
+        assert body["total_pages"] == 2
+
+    async def test_keyset_page(self, api):
+        body = (await api.get("/api/v1/users/?limit=2&after_id=4")).json()
+        assert [user["id"] for user in body["data"]] == [3]
+        # A short page is the last one, and keyset pages are not numbered
+        assert body["next_cursor"] is None
+        assert body["page"] is None
+
+
+@pytest.mark.unit
+class TestUserConditionalGet:
+    """GET /users/{id} with conditional headers"""
+
+    async def test_returns_validators(self, api):
+        response = await api.get("/api/v1/users/5")
+        assert response.status_code == 200
+        assert response.headers["etag"]
+        assert response.headers["last-modified"] == _http_date(LAST_MODIFIED)
+
+    async def test_not_modified_by_etag(self, api):
+        etag = (await api.get("/api/v1/users/5")).headers["etag"]
+        response = await api.get("/api/v1/users/5", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    async def test_not_modified_since(self, api):
+        headers = {"If-Modified-Since": _http_date(LAST_MODIFIED)}
+        response = await api.get("/api/v1/users/5", headers=headers)
+        assert response.status_code == 304
+
+    async def test_missing_user(self, api):
+        assert (await api.get("/api/v1/users/99")).status_code == 404
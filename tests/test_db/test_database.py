@@ -0,0 +1,87 @@
+"""
+Tests for database connection management.
+"""
+
+import asyncio
+import pytest
+from app.db.database import Database, LazyConnection
+from app.services.user_service import UserService, user_cache
+
+
+class FakeConnection:
+    """Pooled connection that opens no-op cursors"""
+
+    def cursor(self, cursor=None):
+        return FakeCursor()
+
+
+class FakeCursor:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakePool:
+    """Pool that counts acquired and released connections"""
+
+    def __init__(self):
+        self.acquired = 0
+        self.released = []
+
+    async def acquire(self):
+        self.acquired += 1
+        # Let concurrent callers interleave, as a real acquire would
+        await asyncio.sleep(0)
+        return FakeConnection()
+
+    async def release(self, conn):
+        self.released.append(conn)
+
+
+@pytest.mark.unit
+class TestLazyConnection:
+    """Connections acquired on first use"""
+
+    async def test_unused_connection_is_never_acquired(self):
+        database = Database()
+        database.pool = pool = FakePool()
+        async with database.get_lazy_connection() as conn:
+            assert not conn.acquired
+        assert pool.acquired == 0
+        assert pool.released == []
+
+    async def test_acquired_once_and_released(self):
+        database = Database()
+        database.pool = pool = FakePool()
+        async with database.get_lazy_connection() as conn:
+            async with conn.cursor():
+                pass
+            async with conn.cursor():
+                pass
+            assert conn.acquired
+        assert pool.acquired == 1
+        assert len(pool.released) == 1
+
+    async def test_concurrent_first_use_acquires_once(self):
+        pool = FakePool()
+        conn = LazyConnection(pool)
+        first, second = await asyncio.gather(conn.acquire(), conn.acquire())
+        assert first is second
+        assert pool.acquired == 1
+
+    async def test_cached_read_does_not_acquire(self):
+        pool = FakePool()
+        conn = LazyConnection(pool)
+        user_cache.set(1, {'id': 1, 'name': 'Cached'})
+        try:
+            assert await UserService(conn).get_user_by_id(1) == {'id': 1, 'name': 'Cached'}
+        finally:
+            user_cache.clear()
+        assert pool.acquired == 0
+
+    async def test_requires_connected_pool(self):
+        with pytest.raises(RuntimeError):
+            async with Database().get_lazy_connection():
+                pass
@@ -0,0 +1,209 @@
+"""
+Tests for the migration helpers.
+"""
+
+import pytest
+from asyncmy.constants import ER
+from asyncmy.errors import OperationalError
+from app.db.migrations import (
+    apply_migration,
+    execute_dml_file,
+    execute_sql_file,
+    is_ddl_migration,
+    record_migrations,
+    split_sql_statements,
+)
+
+MIGRATION = """-- Migration: 00X_example
+ALTER TABLE users ADD INDEX idx_name (name);
+
+-- Second index
+ALTER TABLE users ADD INDEX idx_email (email);
+
+-- Record this migration
+INSERT INTO schema_migrations (migration_file) VALUES ('00X_example.sql');
+"""
+
+FAILED = RuntimeError("failed")
+ALREADY_APPLIED = OperationalError(ER.DUP_KEYNAME, "Duplicate key name 'idx_name'")
+
+
+class FakeCursor:
+    """
+    Cursor that runs multi-statement queries the way MySQL does: statements
+    run in order, and the first failing one raises and ends the batch.
+    """
+
+    def __init__(self, failures=None):
+        # Statement substring -> exception raised when it runs
+        self.failures = failures or {}
+        self.executed = []
+        self.calls = []
+        self._pending = []
+
+    async def execute(self, sql, args=None):
+        self.calls.append(sql)
+        self._pending = split_sql_statements(sql)
+        await self._run_next()
+
+    async def nextset(self):
+        if not self._pending:
+            return None
+        await self._run_next()
+        return True
+
+    async def executemany(self, sql, rows):
+        self.calls.append(sql)
+        self.executed.append((sql, rows))
+
+    async def _run_next(self):
+        statement = self._pending.pop(0)
+        for marker, error in self.failures.items():
+            if marker in statement:
+                self._pending = []
+                raise error
+        self.executed.append(statement)
+
+
+class FakeConnection:
+    """Connection that records transaction control calls"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def begin(self):
+        self.calls.append("begin")
+
+    async def commit(self):
+        self.calls.append("commit")
+
+    async def rollback(self):
+        self.calls.append("rollback")
+
+
+@pytest.mark.unit
+class TestSplitSqlStatements:
+    """Statement splitting"""
+
+    def test_splits_on_semicolons(self):
+        statements = split_sql_statements(MIGRATION)
+        assert len(statements) == 3
+        assert statements[0].endswith("ADD INDEX idx_name (name)")
+        assert statements[2].startswith("-- Record this migration")
+
+    def test_drops_comment_only_chunks(self):
+        sql = "SELECT 1;\n-- trailing comment\n;\n-- another\n"
+        assert split_sql_statements(sql) == ["SELECT 1"]
+
+    def test_empty_file(self):
+        assert split_sql_statements("-- nothing here\n") == []
+
+
+@pytest.mark.unit
+class TestIsDdlMigration:
+    """Migration classification"""
+
+    def test_marker(self):
+        assert is_ddl_migration("-- @ddl\nUPDATE users SET is_active = 1;")
+
+    def test_ddl_statement(self):
+        sql = "-- Add an index\nALTER TABLE users ADD INDEX idx_name (name);"
+        assert is_ddl_migration(sql)
+
+    def test_ddl_keyword_case_insensitive(self):
+        assert is_ddl_migration("create index idx_email ON users (email);")
+
+    def test_dml_only(self):
+        sql = "UPDATE users SET is_active = 1;\nINSERT INTO users (name) VALUES ('a');"
+        assert not is_ddl_migration(sql)
+
+    def test_ddl_keyword_not_at_statement_start(self):
+        assert not is_ddl_migration("UPDATE users SET name = 'drop table';")
+
+
+@pytest.mark.unit
+class TestExecuteSqlFile:
+    """Batched migration execution"""
+
+    async def test_runs_file_as_one_batch(self):
+        cursor = FakeCursor()
+        assert await execute_sql_file(cursor, MIGRATION)
+        assert cursor.calls == [MIGRATION]
+        assert cursor.executed == split_sql_statements(MIGRATION)
+
+    async def test_resumes_at_failed_statement(self):
+        statements = split_sql_statements(MIGRATION)
+        cursor = FakeCursor({"idx_email": FAILED})
+        assert not await execute_sql_file(cursor, MIGRATION)
+        # The statement that succeeded in the batch is not run again
+        assert cursor.calls == [MIGRATION, statements[1], statements[2]]
+        assert cursor.executed == [statements[0], statements[2]]
+
+    async def test_stop_on_error(self):
+        statements = split_sql_statements(MIGRATION)
+        cursor = FakeCursor({"idx_email": FAILED})
+        assert not await execute_sql_file(cursor, MIGRATION, stop_on_error=True)
+        assert cursor.executed == [statements[0]]
+
+    async def test_skips_already_applied_statements(self):
+        statements = split_sql_statements(MIGRATION)
+        cursor = FakeCursor({"idx_name": ALREADY_APPLIED})
+        assert await execute_sql_file(cursor, MIGRATION, stop_on_error=True)
+        assert cursor.executed == statements[1:]
+
+
+@pytest.mark.unit
+class TestExecuteDmlFile:
+    """Transactional data migrations"""
+
+    async def test_commits_on_success(self):
+        conn, cursor = FakeConnection(), FakeCursor()
+        await execute_dml_file(conn, cursor, "UPDATE users SET is_active = 1;")
+        assert conn.calls == ["begin", "commit"]
+
+    async def test_rolls_back_on_failure(self):
+        conn = FakeConnection()
+        cursor = FakeCursor({"DELETE": FAILED})
+        with pytest.raises(RuntimeError):
+            await execute_dml_file(conn, cursor, "UPDATE users SET is_active = 1;\nDELETE FROM users;")
+        assert conn.calls == ["begin", "rollback"]
+
+
+@pytest.mark.unit
+class TestRecordMigrations:
+    """Migration bookkeeping"""
+
+    async def test_records_all_files_in_one_statement(self):
+        cursor = FakeCursor()
+        await record_migrations(cursor, ["001_a.sql", "002_b.sql"])
+        assert len(cursor.executed) == 1
+        sql, rows = cursor.executed[0]
+        assert "ON DUPLICATE KEY UPDATE" in sql
+        assert rows == [("001_a.sql",), ("002_b.sql",)]
+
+
+@pytest.mark.unit
+class TestApplyMigration:
+    """Applying one pending migration file"""
+
+    async def test_failed_ddl_file_stays_pending(self):
+        conn = FakeConnection()
+        cursor = FakeCursor({"idx_email": FAILED})
+        with pytest.raises(RuntimeError):
+            await apply_migration(conn, cursor, "00X_example.sql", MIGRATION)
+        # The self-recording INSERT never ran, and nothing was committed
+        assert not any("schema_migrations" in s for s in cursor.executed)
+        assert conn.calls == ["rollback"]
+
+    async def test_retry_of_partly_applied_ddl_file(self):
+        # idx_name was created by the failed run; idx_email now succeeds
+        conn = FakeConnection()
+        cursor = FakeCursor({"idx_name": ALREADY_APPLIED})
+        await apply_migration(conn, cursor, "00X_example.sql", MIGRATION)
+        assert any("schema_migrations" in s for s in cursor.executed)
+        assert conn.calls == ["commit"]
+
+    async def test_dml_file_runs_in_transaction(self):
+        conn, cursor = FakeConnection(), FakeCursor()
+        await apply_migration(conn, cursor, "00X_data.sql", "UPDATE users SET is_active = 1;")
+        assert conn.calls == ["begin", "commit"]
@@ -0,0 +1,407 @@
+"""
+Tests for the user service layer and its helpers.
+"""
+
+import asyncio
+from types import SimpleNamespace
+import pytest
+from asyncmy.constants import ER
+from asyncmy.errors import IntegrityError
+from app.core import cache as cache_module
+from app.core.config import settings
+from app.services import user_service as user_service_module
+from app.core.cache import TTLCache
+from app.schemas.user_schema import UserCreate, UserUpdate
+from app.services.user_service import (
+    UserService,
+    build_search_query,
+    build_update_sql,
+    user_cache,
+    user_list_cache,
+)
+
+
+class FakeCursor:
+    """DictCursor that records queries and returns the connection's scripted results"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.rowcount = 0
+        self.lastrowid = None
+        self._rows = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, query, args=None):
+        self.conn.queries.append((query, args))
+        # Each result is a list of rows, an affected row count or an exception
+        result = self.conn.results.pop(0) if self.conn.results else []
+        if isinstance(result, Exception):
+            raise result
+        self._rows = result if isinstance(result, list) else []
+        self.rowcount = result if isinstance(result, int) else len(self._rows)
+
+    async def executemany(self, query, args):
+        await self.execute(query, args)
+        self.rowcount = len(args)
+        self.lastrowid = self.conn.next_id
+
+    async def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    async def fetchall(self):
+        return self._rows
+
+
+class FakeConnection:
+    """Autocommit connection that records queries and transaction control"""
+
+    def __init__(self, *results, next_id=1):
+        self.results = list(results)
+        self.next_id = next_id
+        self.queries = []
+        self.calls = []
+
+    def cursor(self, cursor_class=None):
+        return FakeCursor(self)
+
+    def get_transaction_status(self):
+        return False
+
+    async def begin(self):
+        self.calls.append("begin")
+
+    async def commit(self):
+        self.calls.append("commit")
+
+    async def rollback(self):
+        self.calls.append("rollback")
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Keep service results cached by one test out of the next"""
+    yield
+    user_cache.clear()
+    user_list_cache.clear()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the cache module"""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    """In-process TTL cache"""
+
+    def test_get_set(self):
+        cache = TTLCache(ttl=60)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("missing", "default") == "default"
+
+    def test_expiry(self, clock):
+        cache = TTLCache(ttl=60)
+        cache.set("a", 1)
+        clock.value += 61
+        assert cache.get("a") is None
+
+    def test_zero_ttl_disables_caching(self):
+        cache = TTLCache(ttl=0)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_invalidate(self):
+        cache = TTLCache(ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.invalidate("a")
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+    def test_clear(self):
+        cache = TTLCache(ttl=60)
+        cache.set("a", 1)
+        cache.clear()
+        assert cache.get("a") is None
+
+    def test_set_with_current_generation(self):
+        cache = TTLCache(ttl=60)
+        cache.set("a", 1, cache.generation("a"))
+        assert cache.get("a") == 1
+
+    def test_set_skipped_after_invalidate(self):
+        cache = TTLCache(ttl=60)
+        generation = cache.generation("a")
+        cache.invalidate("a")
+        cache.set("a", "stale", generation)
+        assert cache.get("a") is None
+
+    def test_set_skipped_after_clear(self):
+        cache = TTLCache(ttl=60)
+        generation = cache.generation("a")
+        cache.clear()
+        cache.set("a", "stale", generation)
+        assert cache.get("a") is None
+
+    def test_invalidate_other_key_keeps_generation(self):
+        cache = TTLCache(ttl=60)
+        generation = cache.generation("a")
+        cache.invalidate("b")
+        cache.set("a", 1, generation)
+        assert cache.get("a") == 1
+
+    def test_generation_map_stays_bounded(self):
+        cache = TTLCache(ttl=60, maxsize=2)
+        generation = cache.generation("a")
+        for key in range(5):
+            cache.invalidate(key)
+        assert len(cache._generations) <= cache.maxsize
+        # Overflow moved every key to a new generation
+        cache.set("a", "stale", generation)
+        assert cache.get("a") is None
+
+
+@pytest.mark.unit
+class TestBuildUpdateSql:
+    """UPDATE statement builder"""
+
+    def test_single_field(self):
+        assert build_update_sql(("name",)) == (
+            "UPDATE users SET name = %s, updated_at = %s WHERE id = %s"
+        )
+
+    def test_multiple_fields_keep_order(self):
+        assert build_update_sql(("name", "email", "is_active")) == (
+            "UPDATE users SET name = %s, email = %s, is_active = %s, "
+            "updated_at = %s WHERE id = %s"
+        )
+
+    def test_no_fields_sets_only_updated_at(self):
+        assert build_update_sql(()) == "UPDATE users SET updated_at = %s WHERE id = %s"
+
+
+@pytest.mark.unit
+class TestBuildSearchQuery:
+    """Name search statement builder"""
+
+    def test_fulltext_for_long_words(self):
+        query, params = build_search_query("john smith", 10)
+        assert "MATCH(name) AGAINST (%s IN BOOLEAN MODE)" in query
+        assert params == ("+john* +smith*", 10)
+
+    def test_fulltext_strips_operators(self):
+        query, params = build_search_query('-john "smith*" (doe)', 5)
+        assert "MATCH(name)" in query
+        assert params == ("+john* +smith* +doe*", 5)
+
+    def test_like_for_short_word(self):
+        query, params = build_search_query("jo smith", 10)
+        assert "name LIKE %s" in query
+        assert params == ("jo smith%", 10)
+
+    def test_like_for_operators_only(self):
+        query, params = build_search_query("+-", 10)
+        assert "name LIKE %s" in query
+        assert params == ("+-%", 10)
+
+    def test_like_escapes_wildcards(self):
+        _, params = build_search_query("a% b_\\", 10)
+        assert params == ("a\\% b\\_\\\\%", 10)
+
+
+@pytest.mark.unit
+class TestGetAllUsers:
+    """UserService.get_all_users on a fake connection"""
+
+    ROWS = [
+        {'id': 9, 'name': 'A', 'email': 'a@example.com', 'is_active': 1, 'total': 5},
+        {'id': 8, 'name': 'B', 'email': 'b@example.com', 'is_active': 0, 'total': 5},
+    ]
+
+    async def test_offset_page(self):
+        conn = FakeConnection([dict(row) for row in self.ROWS])
+        users, total = await UserService(conn).get_all_users(limit=2, offset=4)
+        assert total == 5
+        assert [user['is_active'] for user in users] == [True, False]
+        assert all('total' not in user for user in users)
+        (query, params), = conn.queries
+        assert query.endswith("LIMIT %s OFFSET %s")
+        assert params == (2, 4)
+
+    async def test_keyset_page(self):
+        conn = FakeConnection([dict(row) for row in self.ROWS])
+        await UserService(conn).get_all_users(limit=2, offset=4, after_id=10, is_active=True)
+        (query, params), = conn.queries
+        # The cursor replaces OFFSET; the total counts the filter only
+        assert "WHERE is_active = %s AND id < %s ORDER BY id DESC LIMIT %s" in query
+        assert "OFFSET" not in query
+        assert params == (True, True, 10, 2)
+
+    async def test_past_last_page_counts_separately(self):
+        conn = FakeConnection([], [{'total': 5}])
+        users, total = await UserService(conn).get_all_users(limit=2, after_id=1)
+        assert (users, total) == ([], 5)
+        assert len(conn.queries) == 2
+
+    async def test_cached_page(self):
+        conn = FakeConnection([dict(row) for row in self.ROWS])
+        service = UserService(conn)
+        first = await service.get_all_users(limit=2)
+        assert await service.get_all_users(limit=2) == first
+        assert len(conn.queries) == 1
+
+
+@pytest.mark.unit
+class TestListVersion:
+    """List version token used for list ETags"""
+
+    def test_stable_until_write(self):
+        service = UserService(FakeConnection())
+        version = service.get_list_version()
+        assert service.get_list_version() == version
+        user_list_cache.clear()
+        assert service.get_list_version() != version
+
+    def test_expires_with_list_cache(self, clock):
+        service = UserService(FakeConnection())
+        version = service.get_list_version()
+        clock.value += settings.CACHE_USER_LIST_TTL + 1
+        assert service.get_list_version() != version
+
+
+@pytest.mark.unit
+class TestUpdateUser:
+    """UserService.update_user on a fake connection"""
+
+    ROW = {'id': 1, 'name': 'New', 'email': 'a@example.com', 'is_active': 1}
+
+    async def test_update_and_reselect_without_transaction(self):
+        conn = FakeConnection(1, [self.ROW])
+        user = await UserService(conn).update_user(1, UserUpdate(name="New"))
+        assert user == self.ROW
+        assert [query.split()[0] for query, _ in conn.queries] == ["UPDATE", "SELECT"]
+        assert conn.calls == []
+
+    async def test_without_reselect_is_one_statement(self):
+        conn = FakeConnection(1)
+        user = await UserService(conn).update_user(1, UserUpdate(name="New"), return_row=False)
+        assert user["name"] == "New"
+        assert len(conn.queries) == 1
+        assert conn.calls == []
+
+    async def test_missing_user(self):
+        conn = FakeConnection(0, [])
+        assert await UserService(conn).update_user(1, UserUpdate(name="New")) is None
+
+    async def test_invalidates_cached_user(self):
+        user_cache.set(1, {'id': 1, 'name': 'Old'})
+        conn = FakeConnection(1, [self.ROW])
+        await UserService(conn).update_user(1, UserUpdate(name="New"))
+        assert user_cache.get(1) is None
+
+
+@pytest.mark.unit
+class TestCreateUsersBulk:
+    """UserService.create_users_bulk on a fake connection"""
+
+    @pytest.fixture
+    def hashing(self, monkeypatch):
+        """Stand-in for password hashing that tracks how many run at once"""
+        state = SimpleNamespace(active=0, peak=0)
+
+        async def fake_hash(password):
+            state.active += 1
+            state.peak = max(state.peak, state.active)
+            await asyncio.sleep(0)
+            state.active -= 1
+            return f"hashed-{password}"
+
+        monkeypatch.setattr(user_service_module, "get_password_hash_async", fake_hash)
+        return state
+
+    @staticmethod
+    def users(count, password="password123"):
+        return [
+            UserCreate(name=f"User {i}", email=f"user{i}@example.com", password=password)
+            for i in range(count)
+        ]
+
+    async def test_creates_users_with_consecutive_ids(self, hashing):
+        conn = FakeConnection(next_id=10)
+        created = await UserService(conn).create_users_bulk(self.users(3))
+        assert [user["id"] for user in created] == [10, 11, 12]
+        assert all("password" not in user for user in created)
+        # One multi-row INSERT, with the hashed passwords
+        (query, rows), = conn.queries
+        assert query.startswith("INSERT INTO users")
+        assert [row[2] for row in rows] == ["hashed-password123"] * 3
+
+    async def test_hash_concurrency_is_bounded(self, hashing, monkeypatch):
+        monkeypatch.setattr(settings, "BULK_HASH_CONCURRENCY", 2)
+        await UserService(FakeConnection()).create_users_bulk(self.users(6))
+        assert hashing.peak == 2
+
+    async def test_duplicate_emails_differing_in_case(self, hashing):
+        conn = FakeConnection()
+        users = [
+            UserCreate(name="A", email="Same@example.com"),
+            UserCreate(name="B", email="same@example.com"),
+        ]
+        with pytest.raises(ValueError, match="Duplicate emails in request"):
+            await UserService(conn).create_users_bulk(users)
+        assert conn.queries == []
+
+    async def test_existing_email(self, hashing):
+        conn = FakeConnection(IntegrityError(ER.DUP_ENTRY, "Duplicate entry"))
+        with pytest.raises(ValueError, match="already exist"):
+            await UserService(conn).create_users_bulk(self.users(2, password=None))
+
+
+@pytest.mark.integration
+class TestUserServiceDatabase:
+    """UserService against the test database, rolled back after each test"""
+
+    async def test_create_and_get_user(self, tx):
+        service = UserService(tx)
+        created = await service.create_user(
+            UserCreate(name="Test User", email="tx-test@example.com", password="password123")
+        )
+        assert "password" not in created
+
+        fetched = await service.get_user_by_id(created["id"])
+        assert fetched["email"] == "tx-test@example.com"
+        assert fetched["is_active"]
+
+    async def test_duplicate_email_rejected(self, tx):
+        service = UserService(tx)
+        user = UserCreate(name="Test User", email="tx-dup@example.com")
+        await service.create_user(user)
+        with pytest.raises(ValueError):
+            await service.create_user(user)
+
+    async def test_delete_user(self, tx):
+        service = UserService(tx)
+        created = await service.create_user(
+            UserCreate(name="Test User", email="tx-delete@example.com")
+        )
+        assert await service.delete_user(created["id"])
+        assert await service.get_user_by_id(created["id"]) is None